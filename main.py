@@ -1,209 +1,680 @@
 import asyncio
-from fastapi import FastAPI, HTTPException
+import httpx
+import redis.asyncio as aioredis
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from playwright.async_api import async_playwright
+import heapq
+import os
 import re
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import datetime
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Selectors for the followers count element, built once at import time.
+# Prioritize the most effective ones first.
+SELECTORS = (
+    '[data-e2e="followers-count"]',
+    'strong[data-e2e="followers-count"]',
+    '[title*="Followers" i]',
+    '.number[data-e2e="followers-count"]',
+    '[data-testid="followers-count"]',
+    'strong[title*="Followers"]',
+)
+
+# Precompiled regexes - compiled once at import time so the page source is
+# scanned a single time instead of once per pattern. The follower pattern
+# works on bytes so the raw page never has to be decoded just to scan it.
+_VALIDATE = re.compile(r"^[\d,.KMBkmb]+$")
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+_FOLLOWER_RE = re.compile(
+    rb'"followerCount"\s*:\s*"?(?P<n>\d+)"?'
+    rb"|(?P<k>[\d,.]+[KMBkmb]?)\s*Followers"
+    rb"|Followers\s*(?P<k2>[\d,.]+[KMBkmb]?)",
+    re.IGNORECASE,
+)
+def _extract_followers(source):
+    """
+    Extract the followers count from raw page bytes, or return None
+    """
+    match = _FOLLOWER_RE.search(source)
+    if match:
+        return (match.group("n") or match.group("k") or match.group("k2")).decode()
+    return None
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Persistent profile directory - keeps Chromium's HTTP/service-worker cache
+# warm across requests so TikTok's JS bundles aren't re-downloaded each time.
+# Wipe it periodically (e.g. daily via cron) to bound growth.
+USER_DATA_DIR = "/tmp/tt-cache"
+# Separate profile for the JS-disabled context (a persistent context owns
+# its profile dir exclusively)
+NOJS_USER_DATA_DIR = "/tmp/tt-cache-nojs"
+
+COOKIE_CLEAR_EVERY = 25  # clear cookies after this many uses to avoid leaking state
+CONTEXT_MAX_USES = 200  # recycle the context after this many uses to cap memory growth
+
+# Page pool settings - pages are pre-warmed and reused so requests skip
+# the new_page/close IPC roundtrips, and rotated out after enough uses
+PAGE_POOL_SIZE = 4
+PAGE_MAX_USES = 50
+
+# Chromium launch flags, shared by initial startup and context recycling
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+    "--disable-background-timer-throttling",
+    "--disable-features=TranslateUI",
+    "--disable-blink-features=AutomationControlled",
+    f"--renderer-process-limit={os.cpu_count() or 2}",
+    "--disable-web-security",  # Added for better compatibility
+    "--no-first-run",
+]
 
 # Global variables for browser instance reuse and caching
 playwright = None
-browser = None
+browser_context = None
+browser_context_nojs = None
+_nojs_lock = asyncio.Lock()
 browser_initialized = False
+_context_uses = 0
+_context_total_uses = 0
+_context_lock = asyncio.Lock()
+# Condition on the same lock: checkouts wait on it while a due recycle
+# drains the stragglers still holding pages
+_context_cond = asyncio.Condition(_context_lock)
+_pages_checked_out = 0
+_page_pool = None
+_page_uses = {}
+http_client = None
+
+# When REDIS_URL is set the cache lives in Redis so multiple instances
+# share one hit ratio; otherwise the in-process LRU below is used.
+REDIS_URL = os.environ.get("REDIS_URL")
+redis_client = None
+
+# Short-TTL LRU cache of follower counts per username. A follower count
+# is fine being up to a minute stale, and cached hits skip the scrape
+# pipeline entirely.
+CACHE_TTL = 60.0
+# Failed lookups are cached too (as None) so floods of bad usernames
+# don't re-run the whole pipeline; kept shorter than successes
+NEGATIVE_CACHE_TTL = 30.0
+CACHE_MAX_SIZE = 10_000
+_followers_cache = OrderedDict()
+# Heap of (expiry, key) pairs so expiry sweeps only touch entries that
+# have actually expired instead of scanning the whole cache
+_cache_expiry_heap = []
+
+# Cap on concurrent scrape pipelines so a burst of cache misses can't
+# spawn unbounded browser work
+SCRAPE_CONCURRENCY = 10
+_scrape_semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+
+# In-flight lookups by cache key, so concurrent requests for the same
+# username share one scrape instead of each launching their own
+_in_flight = {}
+
+# Constant error details, built once at import time. The HTTPException
+# itself is constructed per raise: raising mutates the instance
+# (__traceback__/__context__), so a shared one would cross-contaminate
+# concurrent requests and pin the last request's frames alive.
+_USERNAME_REQUIRED_DETAIL = "Username is required"
+_USERNAME_INVALID_DETAIL = "Invalid username"
+_NOT_FOUND_DETAIL = (
+    "Could not retrieve followers count. The profile might be private, "
+    "not exist, or TikTok might be blocking the request."
+)
+
+
+async def _cache_get(username):
+    """
+    Return (followers, remaining_ttl_seconds) for a username, or None if
+    missing or expired. Failures are cached as None followers.
+    """
+    if redis_client:
+        try:
+            pipe = redis_client.pipeline()
+            pipe.get(username)
+            pipe.ttl(username)
+            followers, remaining = await pipe.execute()
+            if followers is None:
+                return None
+            # The empty string marks a negatively cached failure
+            return followers or None, max(remaining, 0)
+        except Exception as e:
+            logger.warning("Redis cache get failed: %s", e)
+            return None
+
+    entry = _followers_cache.get(username)
+    if not entry:
+        return None
+    expiry, followers = entry
+    remaining = expiry - time.monotonic()
+    if remaining <= 0:
+        _followers_cache.pop(username, None)
+        return None
+    _followers_cache.move_to_end(username)
+    return followers, int(remaining)
+
+
+def _evict_expired():
+    """
+    Drop expired cache entries, touching only the ones whose deadline has
+    passed
+    """
+    now = time.monotonic()
+    while _cache_expiry_heap and _cache_expiry_heap[0][0] <= now:
+        expiry, key = heapq.heappop(_cache_expiry_heap)
+        entry = _followers_cache.get(key)
+        # Only drop the entry if it wasn't refreshed after this heap push
+        if entry and entry[0] <= now:
+            del _followers_cache[key]
+
+
+async def _cache_put(username, followers, ttl=CACHE_TTL):
+    """
+    Cache a followers count (or a None failure), evicting the least
+    recently used entry if full
+    """
+    if redis_client:
+        try:
+            # SETEX handles expiry server-side; "" marks a failure
+            await redis_client.setex(username, int(ttl), followers or "")
+        except Exception as e:
+            logger.warning("Redis cache put failed: %s", e)
+        return
+
+    _evict_expired()
+    expiry = time.monotonic() + ttl
+    _followers_cache[username] = (expiry, followers)
+    _followers_cache.move_to_end(username)
+    heapq.heappush(_cache_expiry_heap, (expiry, username))
+    if len(_followers_cache) > CACHE_MAX_SIZE:
+        _followers_cache.popitem(last=False)
+
+
+# Resource types we never need for reading the DOM
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Analytics/tracker hosts that only add network chatter to a scrape
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "mssdk.tiktokw.us",
+    "mon.tiktokv.us",
+)
+
+
+async def _block_heavy_resources(route):
+    """
+    Abort requests for resources we don't need, so navigation doesn't wait
+    on images, videos, fonts or tracker calls
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in BLOCKED_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _launch_context():
+    """
+    Launch the persistent browser context with the standard configuration
+    """
+    global browser_context, _context_uses, _context_total_uses
+
+    browser_context = await playwright.chromium.launch_persistent_context(
+        USER_DATA_DIR,
+        headless=True,
+        user_agent=USER_AGENT,
+        args=BROWSER_ARGS,
+    )
+    await browser_context.route("**/*", _block_heavy_resources)
+    _context_uses = 0
+    _context_total_uses = 0
+    return browser_context
 
 
 async def init_browser():
     """
-    Initialize the Playwright browser once for reuse across requests
+    Initialize the persistent browser context once for reuse across requests.
+    The whole probe/re-init runs under the context lock so it can't race a
+    recycle that has closed the context but not yet launched its successor.
     """
-    global playwright, browser, browser_initialized
+    global playwright, browser_context, browser_initialized
+
+    async with _context_lock:
+        if browser_initialized and browser_context:
+            # Check if the context is still alive
+            try:
+                await browser_context.cookies()
+                return browser_context
+            except Exception as e:
+                logger.warning("Browser seems to be closed, reinitializing: %s", e)
+                browser_initialized = False
+                browser_context = None
+                playwright = None
 
-    if browser_initialized and browser:
-        # Check if browser is still alive
         try:
-            # Try to get browser contexts to test if browser is still alive
-            await browser.contexts()
-            return browser
+            logger.info("Initializing Playwright browser...")
+
+            # Start Playwright with a persistent context so Chromium keeps a
+            # warm disk cache between requests
+            playwright = await async_playwright().start()
+            await _launch_context()
+
+            browser_initialized = True
+            logger.info("Successfully initialized Playwright browser")
+            return browser_context
+
         except Exception as e:
-            logger.warning(f"Browser seems to be closed, reinitializing: {e}")
+            logger.error("Error initializing browser: %s", e)
             browser_initialized = False
-            browser = None
+            browser_context = None
             playwright = None
+            raise e
+
+
+async def _new_pool_page(context):
+    """
+    Create a fresh page for the pool
+    """
+    page = await context.new_page()
+    _page_uses[page] = 0
+    return page
+
+
+async def init_page_pool():
+    """
+    Pre-warm a pool of pages on the shared context so requests don't pay
+    the page-creation IPC cost
+    """
+    global _page_pool
+
+    context = await init_browser()
+    _page_pool = asyncio.Queue()
+    for _ in range(PAGE_POOL_SIZE):
+        _page_pool.put_nowait(await _new_pool_page(context))
+    logger.info("Initialized page pool with %s pages", PAGE_POOL_SIZE)
+
+
+async def _recycle_context():
+    """
+    Swap in a fresh context once the current one has served enough pages
+    that Chromium's per-navigation leaks start to add up. Must be called
+    with the context lock held and no pages checked out.
+    """
+    logger.info("Recycling browser context after %s uses", _context_total_uses)
+
+    # Pull the idle pages out but keep them on hand: if the relaunch
+    # fails the pool must still end up at full size, or every later
+    # checkout would block forever on an empty queue
+    drained = []
+    while not _page_pool.empty():
+        old = _page_pool.get_nowait()
+        _page_uses.pop(old, None)
+        drained.append(old)
 
     try:
-        logger.info("Initializing Playwright browser...")
+        await browser_context.close()
+    except Exception as e:
+        logger.warning("Error closing recycled context: %s", e)
+
+    new_pages = []
+    try:
+        context = await _launch_context()
+        for _ in range(PAGE_POOL_SIZE):
+            new_pages.append(await _new_pool_page(context))
+    finally:
+        # On failure, pad with the drained (now closed) pages; checkouts
+        # replace closed pages once the browser is back up
+        while len(new_pages) < PAGE_POOL_SIZE and drained:
+            new_pages.append(drained.pop())
+        for pooled in new_pages:
+            _page_pool.put_nowait(pooled)
+    return context
+
+
+async def _get_nojs_context():
+    """
+    Lazily launch a second context with JavaScript disabled. The embedded
+    profile stats are server-rendered, so this rung reads them with real
+    browser networking but without paying for V8 execution.
+    """
+    global browser_context_nojs
 
-        # Start Playwright
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
+    # Serialize the lazy launch: a persistent context owns its profile
+    # dir, so two concurrent launches would race the profile lock and
+    # leak the losing Chromium process
+    async with _nojs_lock:
+        if browser_context_nojs:
+            try:
+                await browser_context_nojs.cookies()
+                return browser_context_nojs
+            except Exception as e:
+                logger.warning("No-JS context seems to be closed, relaunching: %s", e)
+                browser_context_nojs = None
+
+        await init_browser()
+        browser_context_nojs = await playwright.chromium.launch_persistent_context(
+            NOJS_USER_DATA_DIR,
             headless=True,
-            args=[
-                "--single-process",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-background-networking",
-                "--disable-default-apps",
-                "--disable-extensions",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-ipc-flooding-protection",
-                "--disable-background-timer-throttling",
-                "--disable-features=TranslateUI",
-                "--disable-web-security",  # Added for better compatibility
-                "--no-first-run",
-            ],
+            user_agent=USER_AGENT,
+            java_script_enabled=False,
+            service_workers="block",
+            args=BROWSER_ARGS,
         )
+        await browser_context_nojs.route("**/*", _block_heavy_resources)
+        return browser_context_nojs
 
-        browser_initialized = True
-        logger.info("Successfully initialized Playwright browser")
-        return browser
 
+async def _fetch_nojs(username):
+    """
+    Fetch the profile on the JS-disabled context and scan the raw HTML
+    """
+    page = None
+    try:
+        context = await _get_nojs_context()
+        page = await context.new_page()
+        await page.goto(
+            f"https://www.tiktok.com/@{username}",
+            wait_until="domcontentloaded",
+            timeout=15000,
+        )
+        followers_count = _extract_followers((await page.content()).encode())
+        if followers_count:
+            logger.info("Followers found via no-JS context: %s", followers_count)
+        return followers_count
     except Exception as e:
-        logger.error(f"Error initializing browser: {e}")
-        browser_initialized = False
-        browser = None
-        playwright = None
-        raise e
+        logger.info("No-JS fetch failed for '%s': %s", username, e)
+        return None
+    finally:
+        try:
+            if page:
+                await page.close()
+        except Exception:
+            pass
+
+
+async def _acquire_page():
+    """
+    Get a warm page from the pool, replacing it if it has gone stale
+    """
+    global _pages_checked_out
+
+    if _page_pool is None:
+        await init_page_pool()
+
+    context = await init_browser()
+
+    async with _context_cond:
+        # Once the context is due for recycling, stop handing out pages;
+        # the last release notifies and the first waiter does the swap
+        while _context_total_uses >= CONTEXT_MAX_USES and _pages_checked_out > 0:
+            await _context_cond.wait()
+        if _context_total_uses >= CONTEXT_MAX_USES:
+            context = await _recycle_context()
+        _pages_checked_out += 1
+
+    page = None
+    try:
+        page = await _page_pool.get()
+        if page.is_closed():
+            replacement = await _new_pool_page(context)
+            _page_uses.pop(page, None)
+            page = replacement
+        return page
+    except Exception:
+        # Keep the pool at full size and the checkout count balanced
+        if page is not None:
+            _page_pool.put_nowait(page)
+        async with _context_cond:
+            _pages_checked_out -= 1
+            _context_cond.notify_all()
+        raise
+
+
+async def _release_page(page):
+    """
+    Return a page to the pool, resetting it to about:blank and rotating
+    it out after enough uses
+    """
+    global _pages_checked_out
+
+    try:
+        _page_uses[page] = _page_uses.get(page, 0) + 1
+        if _page_uses[page] >= PAGE_MAX_USES:
+            _page_uses.pop(page, None)
+            await page.close()
+            page = await _new_pool_page(browser_context)
+        else:
+            await page.goto("about:blank")
+    except Exception as e:
+        # A closed page is still safe to pool; _acquire_page replaces it
+        logger.warning("Error resetting pooled page: %s", e)
+    _page_pool.put_nowait(page)
+
+    async with _context_cond:
+        _pages_checked_out -= 1
+        if _pages_checked_out == 0:
+            # Wake any checkout waiting to recycle the context
+            _context_cond.notify_all()
+
+
+async def _release_context(context):
+    """
+    Mark the shared context as used, periodically clearing cookies so
+    state doesn't leak between users
+    """
+    global _context_uses, _context_total_uses
+
+    try:
+        _context_uses += 1
+        _context_total_uses += 1
+        if _context_uses >= COOKIE_CLEAR_EVERY:
+            await context.clear_cookies()
+            _context_uses = 0
+    except Exception as e:
+        logger.warning("Error clearing context cookies: %s", e)
 
 
 async def cleanup_browser():
     """
     Clean up browser resources
     """
-    global playwright, browser, browser_initialized
+    global playwright, browser_context, browser_context_nojs, browser_initialized
+    global _page_pool, _pages_checked_out
+
+    _page_pool = None
+    _page_uses.clear()
+    _pages_checked_out = 0
 
     try:
-        if browser:
-            await browser.close()
+        if browser_context:
+            await browser_context.close()
     except Exception as e:
-        logger.warning(f"Error closing browser: {e}")
+        logger.warning("Error closing browser: %s", e)
+
+    try:
+        if browser_context_nojs:
+            await browser_context_nojs.close()
+    except Exception as e:
+        logger.warning("Error closing no-JS context: %s", e)
 
     try:
         if playwright:
             await playwright.stop()
     except Exception as e:
-        logger.warning(f"Error stopping playwright: {e}")
+        logger.warning("Error stopping playwright: %s", e)
 
-    browser = None
+    browser_context = None
+    browser_context_nojs = None
     playwright = None
     browser_initialized = False
 
 
+# Candidate profile URLs for the HTTP fast path; both carry the embedded
+# profile stats, so they are raced and the first hit wins
+_PROFILE_URL_TEMPLATES = (
+    "https://www.tiktok.com/@{username}",
+    "https://www.tiktok.com/@{username}?lang=en",
+)
+
+
+async def _fetch_profile(url):
+    """
+    Fetch one candidate profile URL and extract the followers count from it
+    """
+    try:
+        response = await http_client.get(url)
+        if response.status_code != 200:
+            return None
+        return _extract_followers(response.content)
+    except Exception as e:
+        logger.info("HTTP fetch failed for '%s': %s", url, e)
+        return None
+
+
+async def _fetch_http(username):
+    """
+    Try to read the followers count straight from the server-rendered HTML
+    with plain HTTP GETs, avoiding the browser entirely. The candidate
+    URLs are fetched concurrently and the first success cancels the rest.
+    """
+    if not http_client:
+        return None
+
+    tasks = [
+        asyncio.create_task(_fetch_profile(template.format(username=username)))
+        for template in _PROFILE_URL_TEMPLATES
+    ]
+    followers_count = None
+    try:
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            if result:
+                followers_count = result
+                logger.info("Followers found via HTTP fast path: %s", followers_count)
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return followers_count
+
+
 async def get_tiktok_followers_with_playwright(username):
     """
     Scrape TikTok followers count using Playwright to handle JavaScript rendering
     """
     page = None
 
-    try:
-        # Initialize browser if not already done or if it's been closed
-        browser_instance = await init_browser()
-
-        url = f"https://www.tiktok.com/@{username}"
-        logger.info(f"Scraping followers count from: {url}")
+    # Fast path: a plain HTTP request is often enough since TikTok embeds
+    # the profile stats in the initial HTML
+    followers_count = await _fetch_http(username)
+    if followers_count:
+        return followers_count
 
-        # Create a new browser context for isolation
-        context = await browser_instance.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+    # Middle rung: a JS-disabled browser navigation gets past blocks the
+    # bare HTTP client hits while still skipping V8 execution entirely
+    followers_count = await _fetch_nojs(username)
+    if followers_count:
+        return followers_count
 
-        # Create a new page
-        page = await context.new_page()
+    try:
+        url = f"https://www.tiktok.com/@{username}"
+        logger.info("Scraping followers count from: %s", url)
 
-        # Navigate to the TikTok profile with longer timeout
-        try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-        except Exception as e:
-            logger.warning(f"Network idle timeout, continuing anyway: {e}")
-            await page.goto(url, timeout=30000)
+        # Get a warm page from the pool; the shared persistent context
+        # keeps Chromium's disk cache warm across requests
+        page = await _acquire_page()
 
-        # Wait for the page to load
-        await page.wait_for_timeout(5000)
+        # Navigate to the TikTok profile; domcontentloaded returns as soon
+        # as the HTML parses instead of waiting for the network to go idle
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
 
         followers_count = None
 
-        # Try to find the followers count element with optimized selectors
+        # Race all selectors at once and take whichever appears first,
+        # instead of sleeping and trying each selector serially
         logger.info("Looking for followers count element...")
-
-        # Optimized selectors - prioritize the most effective ones first
-        selectors = [
-            '[data-e2e="followers-count"]',
-            'strong[data-e2e="followers-count"]',
-            '[title*="Followers" i]',
-            '.number[data-e2e="followers-count"]',
-            '[data-testid="followers-count"]',
-            'strong[title*="Followers"]',
-        ]
-
-        # Try each selector
-        for selector in selectors:
-            try:
-                logger.info(f"Trying selector: {selector}")
-                element = await page.wait_for_selector(selector, timeout=8000)
-                if element:
-                    text = await element.text_content()
-                    text = text.strip() if text else ""
-                    if text and re.match(r"^[\d,.KMBkmb]+$", text):
-                        followers_count = text
-                        logger.info(
-                            f"Followers found with selector '{selector}': {followers_count}"
-                        )
-                        break
-            except Exception as e:
-                logger.info(f"Selector '{selector}' not found or timeout: {e}")
-                continue
+        try:
+            locator = page.locator(SELECTORS[0])
+            for selector in SELECTORS[1:]:
+                locator = locator.or_(page.locator(selector))
+            await locator.first.wait_for(timeout=8000)
+            text = await locator.first.text_content()
+            text = text.strip() if text else ""
+            if text and _VALIDATE.match(text):
+                followers_count = text
+                logger.info("Followers found via selector race: %s", followers_count)
+        except Exception as e:
+            logger.info("No followers selector matched: %s", e)
 
         # If we still haven't found it, try a more general approach
         if not followers_count:
             logger.info("Trying general text search...")
             try:
-                # Get page source
-                page_source = await page.content()
-
-                # Look for patterns in the page source
-                patterns = [
-                    r'"followerCount"\s*:\s*"(\d+)"',
-                    r'"followerCount"\s*:\s*(\d+)',
-                    r"([\d,.]+[KMBkmb]?)\s*Followers",
-                    r"Followers\s*([\d,.]+[KMBkmb]?)",
-                    r'"stats".*?"followerCount"\s*:\s*"?(\d+)"?',
-                ]
-
-                for pattern in patterns:
-                    matches = re.findall(pattern, page_source, re.IGNORECASE)
-                    if matches:
-                        followers_count = matches[0]
-                        logger.info(
-                            f"Followers found with pattern '{pattern}': {followers_count}"
-                        )
-                        break
+                # Get page source once and scan it in a single pass with
+                # the combined pattern
+                page_source = (await page.content()).encode()
+                followers_count = _extract_followers(page_source)
+                if followers_count:
+                    logger.info("Followers found in page source: %s", followers_count)
 
             except Exception as e:
-                logger.error(f"Error during general search: {e}")
+                logger.error("Error during general search: %s", e)
 
-        # Close the context (which closes all pages in it)
-        await context.close()
+        # Hand the page back to the pool; the shared context stays open
+        await _release_page(page)
+        await _release_context(browser_context)
 
         return followers_count
 
     except Exception as e:
-        logger.error(f"Error in get_tiktok_followers_with_playwright: {e}")
+        logger.error("Error in get_tiktok_followers_with_playwright: %s", e)
         # Clean up in case of error
-        try:
-            if page:
-                await page.close()
-        except:
-            pass
+        if page:
+            await _release_page(page)
+            await _release_context(browser_context)
         return None
 
 
+# Lookup table mapping a suffix character to its decimal exponent
+# (K -> 3, M -> 6, B -> 9), 255 meaning "no suffix". Built once at import
+# time so parsing a count is a single indexed load instead of dict lookups.
+_NO_SUFFIX = 255
+_SUFFIX_EXP = bytearray([_NO_SUFFIX] * 256)
+for _chars, _exp in ((b"Kk", 3), (b"Mm", 6), (b"Bb", 9)):
+    for _char in _chars:
+        _SUFFIX_EXP[_char] = _exp
+_SUFFIX_EXP = bytes(_SUFFIX_EXP)
+
+
 def format_followers_count(count):
     """
     Format the followers count for better readability
@@ -211,31 +682,21 @@ def format_followers_count(count):
     if not count:
         return "Unknown"
 
-    # Handle formatted numbers like 1.2M, 3.4K, etc.
-    multipliers = {
-        "K": 1000,
-        "M": 1000000,
-        "B": 1000000000,
-        "k": 1000,
-        "m": 1000000,
-        "b": 1000000000,
-    }
-
     # Remove any commas first
     count = str(count).replace(",", "")
 
-    # If it's already a number, just return it formatted
-    if count.isdigit():
+    # If it's already a number, just return it formatted; the
+    # isascii/isdecimal pair is a single C pass over the string
+    if count.isascii() and count.isdecimal():
         return f"{int(count):,}"
 
-    # Check if it has a multiplier
-    if len(count) > 0:
-        suffix = count[-1]
-        if suffix in multipliers:
+    # Check if it has a multiplier suffix like 1.2M or 3.4K
+    if count:
+        suffix = ord(count[-1])
+        exp = _SUFFIX_EXP[suffix] if suffix < 256 else _NO_SUFFIX
+        if exp != _NO_SUFFIX:
             try:
-                number = float(count[:-1])
-                count_value = number * multipliers[suffix]
-                return f"{int(count_value):,}"
+                return f"{int(float(count[:-1]) * 10 ** exp):,}"
             except ValueError:
                 return count
 
@@ -244,13 +705,38 @@ def format_followers_count(count):
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize browser on startup"""
-    await init_browser()
+    """Initialize the HTTP client, cache backend, browser and page pool on startup"""
+    global http_client, redis_client
+    if REDIS_URL:
+        redis_client = aioredis.from_url(REDIS_URL, decode_responses=True)
+        logger.info("Using Redis cache backend")
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=5,
+        limits=httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=16,
+            keepalive_expiry=30,
+        ),
+        headers={
+            "User-Agent": USER_AGENT,
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+        follow_redirects=True,
+    )
+    await init_page_pool()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up browser on shutdown"""
+    """Clean up the HTTP client, cache backend and browser on shutdown"""
+    global http_client, redis_client
+    if redis_client:
+        await redis_client.aclose()
+        redis_client = None
+    if http_client:
+        await http_client.aclose()
+        http_client = None
     await cleanup_browser()
 
 
@@ -267,44 +753,120 @@ async def home():
 
 @app.get("/health")
 async def health():
-    global browser, browser_initialized
+    global browser_context, browser_initialized
     browser_status = (
-        "initialized" if browser_initialized and browser else "not initialized"
+        "initialized" if browser_initialized and browser_context else "not initialized"
     )
     return {"status": "healthy", "browser_status": browser_status}
 
 
+def _caching_headers(cache_key, followers, remaining):
+    """
+    Build Cache-Control/ETag headers matching the server-side TTL so
+    clients and CDNs can reuse the response
+    """
+    return {
+        "Cache-Control": f"public, max-age={remaining}",
+        "ETag": f'"{cache_key}:{followers}"',
+    }
+
+
 @app.get("/followers/{username}")
-async def get_followers(username: str):
+async def get_followers(username: str, request: Request):
     # Validate username
     if not username or len(username.strip()) == 0:
-        raise HTTPException(status_code=400, detail="Username is required")
+        raise HTTPException(status_code=400, detail=_USERNAME_REQUIRED_DETAIL)
 
     # Clean username (remove @ if present)
     username = username.strip().lstrip("@")
+    if not _USERNAME_RE.match(username):
+        raise HTTPException(status_code=400, detail=_USERNAME_INVALID_DETAIL)
+
+    # TikTok usernames are case-insensitive, so cache on the lowercased
+    # name directly - the dict hashes short strings in C, no digest needed
+    cache_key = username.lower()
 
     try:
-        # Get followers count
-        followers = await get_tiktok_followers_with_playwright(username)
+        # Serve from cache when the count was fetched recently
+        cached = await _cache_get(cache_key)
+        if cached:
+            followers, remaining = cached
+            # A cached failure means the last full lookup found nothing
+            if followers is None:
+                raise HTTPException(status_code=404, detail=_NOT_FOUND_DETAIL)
+            headers = _caching_headers(cache_key, followers, remaining)
+            # A matching ETag means the client already has this value
+            if request.headers.get("if-none-match") == headers["ETag"]:
+                return Response(status_code=304, headers=headers)
+            return ORJSONResponse(
+                {
+                    "username": username,
+                    "followers": followers,
+                    "formatted_followers": format_followers_count(followers),
+                    "status": "success",
+                    "cached": True,
+                    "timestamp": datetime.now().isoformat(),
+                },
+                headers=headers,
+            )
+
+        # Coalesce concurrent lookups: if another request is already
+        # fetching this username, await its result instead of scraping too
+        future = _in_flight.get(cache_key)
+        if future is not None:
+            followers = await future
+        else:
+            future = asyncio.get_running_loop().create_future()
+            _in_flight[cache_key] = future
+            try:
+                # Get followers count, bounded by the scrape concurrency cap
+                async with _scrape_semaphore:
+                    followers = await get_tiktok_followers_with_playwright(username)
+
+                if followers:
+                    await _cache_put(cache_key, followers)
+                else:
+                    # Remember the failure so repeat lookups for a bad
+                    # username don't re-run the whole pipeline
+                    await _cache_put(cache_key, None, ttl=NEGATIVE_CACHE_TTL)
+                future.set_result(followers)
+            finally:
+                # Resolve unconditionally - also on errors and on
+                # cancellation (client disconnect, shutdown), which
+                # except Exception would miss - so waiters see a miss
+                # instead of awaiting forever; any error still surfaces
+                # from this request
+                if not future.done():
+                    future.set_result(None)
+                _in_flight.pop(cache_key, None)
 
         if followers:
             formatted_count = format_followers_count(followers)
-            return {
-                "username": username,
-                "followers": followers,
-                "formatted_followers": formatted_count,
-                "status": "success",
-                "timestamp": datetime.now().isoformat(),
-            }
-        else:
-            raise HTTPException(
-                status_code=404,
-                detail="Could not retrieve followers count. The profile might be private, not exist, or TikTok might be blocking the request.",
+            return ORJSONResponse(
+                {
+                    "username": username,
+                    "followers": followers,
+                    "formatted_followers": formatted_count,
+                    "status": "success",
+                    "cached": False,
+                    "timestamp": datetime.now().isoformat(),
+                },
+                headers=_caching_headers(cache_key, followers, int(CACHE_TTL)),
             )
+        else:
+            raise HTTPException(status_code=404, detail=_NOT_FOUND_DETAIL)
 
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"Unexpected error for username '{username}': {e}")
+        logger.error("Unexpected error for username '%s': %s", username, e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Single worker on purpose: the process owns one Chromium instance
+    # and the in-process cache; scale by running more instances instead
+    uvicorn.run("main:app", host="0.0.0.0", port=8080, loop="uvloop", http="httptools")
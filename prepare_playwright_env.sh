@@ -2,7 +2,7 @@
 
 set -e
 # Install FastAPI, Uvicorn, Pytest, and Playwright
-pip install fastapi uvicorn pytest-playwright python-multipart jinja2
+pip install fastapi uvicorn pytest-playwright python-multipart jinja2 "httpx[http2]" orjson uvloop httptools redis
 
 # Install Playwright and its dependencies
 playwright install --with-deps chromium
\ No newline at end of file